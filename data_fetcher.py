@@ -1,4 +1,5 @@
 import os
+import asyncio
 import aiohttp
 from dotenv import load_dotenv
 
@@ -8,13 +9,40 @@ class ForexDataFetcher:
     def __init__(self, twelve_data_key=None, alpha_vantage_key=None):
         self.twelve_data_key = twelve_data_key or os.getenv("TWELVE_DATA_API_KEY")
         self.alpha_vantage_key = alpha_vantage_key or os.getenv("ALPHA_VANTAGE_API_KEY")
-        self.session = aiohttp.ClientSession()
+        # Created on first request so it binds to the running event loop
+        self.session = None
+
+    async def _ensure_session(self):
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=30)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+        return self.session
 
     async def fetch_data(self, symbol):
         # Placeholder for fetching data; implement your API calls here
         url = f"https://api.twelvedata.com/time_series?symbol={symbol}&apikey={self.twelve_data_key}"
-        async with self.session.get(url) as response:
+        session = await self._ensure_session()
+        async with session.get(url) as response:
             return await response.json()
 
+    async def fetch_many(self, symbols, concurrency=8):
+        # Semaphore keeps bursts within the provider's rate limit.
+        # A failed symbol maps to its exception so the rest of the batch survives.
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(symbol):
+            async with sem:
+                try:
+                    return symbol, await self.fetch_data(symbol)
+                except Exception as exc:
+                    return symbol, exc
+
+        return dict(await asyncio.gather(*(one(s) for s in symbols)))
+
     async def close(self):
-        await self.session.close()
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
@@ -26,7 +26,16 @@ def main():
     if not TOKEN:
         raise RuntimeError("TELEGRAM_BOT_TOKEN is missing (Render env var).")
 
-    app = Application.builder().token(TOKEN).build()
+    # Separate HTTPX pools so long-polling getUpdates never starves outbound replies
+    app = (
+        Application.builder()
+        .token(TOKEN)
+        .connection_pool_size(32)
+        .pool_timeout(10)
+        .get_updates_connection_pool_size(4)
+        .get_updates_pool_timeout(65)
+        .build()
+    )
 
     # Commands
     app.add_handler(CommandHandler("start", start))
@@ -35,7 +44,13 @@ def main():
     print("🚀 Bot started. Waiting for updates...")
     # Let PTB manage the event loop; don't wrap with asyncio.run().
     # close_loop=False avoids 'Cannot close a running event loop' in some hosts.
-    app.run_polling(close_loop=False)
+    # 30s long-poll with no gap between cycles; only command messages are handled.
+    app.run_polling(
+        timeout=30,
+        poll_interval=0.0,
+        allowed_updates=[Update.MESSAGE],
+        close_loop=False,
+    )
 
 if __name__ == "__main__":
     main()
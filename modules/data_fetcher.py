@@ -1,18 +1,62 @@
-import os, httpx, asyncio, json
+import os, httpx, asyncio, json, time
 
 TD_API = os.getenv("TWELVE_DATA_API_KEY")
 FH_API = os.getenv("FINNHUB_API_KEY")
 
+_CLIENT: httpx.AsyncClient | None = None
+
+async def _client() -> httpx.AsyncClient:
+    """Process-wide client so repeat lookups reuse keep-alive connections."""
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        )
+    return _CLIENT
+
 async def _get_json(url: str) -> dict:
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        r = await client.get(url)
+    client = await _client()
+    r = await client.get(url)
     try:
         return r.json()
     except Exception:
         return {"error": "Bad JSON", "text": r.text}
 
+_PRICE_TTL = 10.0                                   # seconds
+_PRICE_CACHE: dict[str, tuple[float, float]] = {}   # symbol -> (fetched_at, price)
+_PRICE_INFLIGHT: dict[str, asyncio.Task] = {}      # symbol -> running fetch
+
+def _cached_price(symbol: str):
+    hit = _PRICE_CACHE.get(symbol)
+    if hit and time.monotonic() - hit[0] < _PRICE_TTL:
+        return hit[1]
+    return None
+
+async def _fetch_and_cache(symbol: str):
+    try:
+        price = await _fetch_price(symbol)
+        if isinstance(price, float):
+            now = time.monotonic()
+            for stale in [k for k, (ts, _) in _PRICE_CACHE.items() if now - ts >= _PRICE_TTL]:
+                del _PRICE_CACHE[stale]
+            _PRICE_CACHE[symbol] = (now, price)
+        return price
+    finally:
+        _PRICE_INFLIGHT.pop(symbol, None)
+
 async def get_price(symbol: str):
-    """Return float price or str error."""
+    """Return float price or str error. Successful lookups are reused for a few seconds."""
+    price = _cached_price(symbol)
+    if price is not None:
+        return price
+    # One upstream request per symbol; concurrent callers await the same task
+    task = _PRICE_INFLIGHT.get(symbol)
+    if task is None:
+        task = _PRICE_INFLIGHT[symbol] = asyncio.ensure_future(_fetch_and_cache(symbol))
+    return await asyncio.shield(task)
+
+async def _fetch_price(symbol: str):
     # --- Twelve-Data first --------------------------------------------------
     if TD_API:
         td_symbol = symbol.replace("/", "")
@@ -1,7 +1,8 @@
 from dotenv import load_dotenv
 load_dotenv()
 # — TomaiSignalAI telegram handler —————————————
-import os, asyncio, httpx, logging, re
+import os, asyncio, httpx, logging, re, time
+from html import escape
 from telegram import Update
 from telegram.ext import (
     Application, CommandHandler, ContextTypes, Defaults   # ← fixed here
@@ -11,25 +12,45 @@ TD_KEY  = os.getenv("TWELVE_DATA_API_KEY")
 FH_KEY  = os.getenv("FINNHUB_API_KEY")
 BOT_TOK = os.getenv("TELEGRAM_BOT_TOKEN")
 
+_HTTP: httpx.AsyncClient | None = None     # shared keep-alive client
+
+def _http() -> httpx.AsyncClient:
+    global _HTTP
+    if _HTTP is None or _HTTP.is_closed:
+        _HTTP = httpx.AsyncClient(
+            timeout=5,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        )
+    return _HTTP
+
+async def _close_http(_app=None):
+    global _HTTP
+    if _HTTP is not None:
+        await _HTTP.aclose()
+        _HTTP = None
+
 app = (
     Application
       .builder()
       .token(BOT_TOK)
       .defaults(Defaults(parse_mode="HTML"))
+      .connection_pool_size(32)                 # outbound replies
+      .pool_timeout(10)
+      .get_updates_connection_pool_size(4)      # long-poll only
+      .get_updates_pool_timeout(65)
+      .post_shutdown(_close_http)
       .build()
 )
 
 # --------------------------------------------------------
 async def _twelvedata_price(sym:str) -> float:
     url = f"https://api.twelvedata.com/price?symbol={sym}&apikey={TD_KEY}"
-    async with httpx.AsyncClient(timeout=5) as cli:
-        r = await cli.get(url)
+    r = await _http().get(url)
     return float(r.json()["price"])
 
 async def _finnhub_price(sym:str) -> float:
     url = f"https://finnhub.io/api/v1/quote?symbol={sym}&token={FH_KEY}"
-    async with httpx.AsyncClient(timeout=5) as cli:
-        r = await cli.get(url)
+    r = await _http().get(url)
     return float(r.json()["c"])
 
 SYMBOL_MAP = {             # Forex ↔ API symbols
@@ -37,8 +58,32 @@ SYMBOL_MAP = {             # Forex ↔ API symbols
 }
 FH_PREFIX = "OANDA:"       # Finnhub wants “OANDA:EUR_USD”
 
+PRICE_TTL = 10.0           # seconds a quote is reused
+_price_cache: dict[str, tuple[float, str]] = {}
+_price_inflight: dict[str, asyncio.Task] = {}   # only symbols being fetched
+
+async def _fetch_and_cache(sym:str) -> str:
+    try:
+        price = await _fetch_price(sym)
+        now = time.monotonic()
+        for stale in [k for k, (ts, _) in _price_cache.items() if now - ts >= PRICE_TTL]:
+            del _price_cache[stale]     # keep only quotes still inside the TTL
+        _price_cache[sym] = (now, price)
+        return price
+    finally:
+        _price_inflight.pop(sym, None)
+
 async def get_price(sym:str) -> str:
     sym = sym.upper().replace("/","")
+    hit = _price_cache.get(sym)
+    if hit and time.monotonic() - hit[0] < PRICE_TTL:
+        return hit[1]
+    task = _price_inflight.get(sym)         # collapse bursts into one fetch
+    if task is None:
+        task = _price_inflight[sym] = asyncio.ensure_future(_fetch_and_cache(sym))
+    return await asyncio.shield(task)
+
+async def _fetch_price(sym:str) -> str:
     td_sym = SYMBOL_MAP.get(sym, sym)
     try:
         p = await _twelvedata_price(td_sym)
@@ -58,11 +103,11 @@ async def analyze(update: Update, ctx: ContextTypes.DEFAULT_TYPE):
     sym = ctx.args[0].upper()
     try:
         price = await get_price(sym)
-        await update.message.reply_text(f"<b>{sym}</b> ⇒ {price}")
+        await update.message.reply_text(f"<b>{escape(sym)}</b> ⇒ {price}")
     except ValueError:
         await update.message.reply_text("⚠️ Unrecognised symbol")
     except Exception as e:
-        await update.message.reply_text(f"⚠️ Error: {e}")
+        await update.message.reply_text(f"⚠️ Error: {escape(str(e))}")
 
 async def scan(update: Update, ctx: ContextTypes.DEFAULT_TYPE):
     await update.message.reply_text("Scan coming soon…")
@@ -1,14 +1,33 @@
 import os
+import time
+import asyncio
 from telegram import Update
 from telegram.ext import ApplicationBuilder, CommandHandler, ContextTypes
 from main import MobileForexBot
 from dotenv import load_dotenv
+from config.settings import ALL_PAIRS, DATA_SETTINGS
 
 load_dotenv()
 
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 bot_core = MobileForexBot()
 
+ANALYSIS_TTL = DATA_SETTINGS['cache_duration']
+CACHEABLE_PAIRS = {p.replace("/", "") for p in ALL_PAIRS}
+_analysis_cache = {}  # pair -> (time bucket, result); known pairs only
+
+def cached_analyze(pair):
+    """Reuse an analysis for repeat requests within the same time bucket."""
+    if pair not in CACHEABLE_PAIRS:
+        return bot_core.analyze(pair)
+    bucket = int(time.time() // ANALYSIS_TTL)
+    hit = _analysis_cache.get(pair)
+    if hit and hit[0] == bucket:
+        return hit[1]
+    result = bot_core.analyze(pair)
+    _analysis_cache[pair] = (bucket, result)
+    return result
+
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await update.message.reply_text(
         "👋 Welcome to TomaiSignalBot!\n"
@@ -21,7 +40,8 @@ async def analyze(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     pair = context.args[0].upper().replace("/", "")
-    result = bot_core.analyze(pair)
+    # Blocking fetch + indicator work; keep it off the event loop
+    result = await asyncio.to_thread(cached_analyze, pair)
     await update.message.reply_text(result, parse_mode="Markdown")
 
 def run_bot():